@@ -0,0 +1,67 @@
+# Response caching for read-heavy endpoints (Redis; disabled without it)
+from fastapi import Request
+from fastapi_cache import FastAPICache
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Environment variable handling
+from dotenv import load_dotenv
+import logging
+import os
+
+# Load environment variables from .env file
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Redis connection for the response cache; caching is disabled when unset
+REDIS_URL = os.getenv("REDIS_URL")
+
+# Cache lifetimes (seconds) for list and single-item GET endpoints
+LIST_CACHE_EXPIRE = 60
+ITEM_CACHE_EXPIRE = 300
+
+def request_key_builder(func, namespace: str = "", *, request: Request = None, **kwargs) -> str:
+    """
+    Builds cache keys from the request path and query string, so injected
+    dependencies such as the database handle never end up in the key.
+    """
+    return f"{namespace}:{request.url.path}?{request.url.query}"
+
+async def clear_cache(namespace: str):
+    """
+    Invalidates every cached response in a namespace after a write.
+    The write has already been committed, so a cache backend error is
+    logged instead of failing the request (matching how fastapi-cache2
+    handles errors on cache reads).
+    """
+    try:
+        await FastAPICache.clear(namespace=namespace)
+    except Exception:
+        logger.warning("Error clearing cache namespace '%s':", namespace, exc_info=True)
+
+class NoClientCacheMiddleware:
+    """
+    Replaces the max-age Cache-Control header that fastapi-cache2 adds to
+    cached responses with no-cache. Only the server-side cache is cleared on
+    writes, so clients must revalidate (via the ETag) instead of reusing a
+    response that may already be stale.
+    """
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_header = FastAPICache.get_cache_status_header().lower()
+
+        async def send_no_cache(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if status_header in headers:
+                    headers["Cache-Control"] = "no-cache"
+            await send(message)
+
+        await self.app(scope, receive, send_no_cache)
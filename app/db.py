@@ -0,0 +1,127 @@
+# Native asyncio MongoDB driver (PyMongo) and GridFS bucket types
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import OperationFailure
+from gridfs import AsyncGridFSBucket
+
+# FastAPI dependency injection and HTTP errors
+from fastapi import Depends, HTTPException, Request
+
+# MongoDB ObjectId handling
+from bson import ObjectId
+from bson.errors import InvalidId
+
+# Environment variable handling
+from dotenv import load_dotenv
+from typing import Annotated
+import asyncio
+import logging
+import os
+
+# Load environment variables from .env file
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# MongoDB connection configuration
+MONGO_URI = os.getenv("MONGO_URI")
+DB_NAME = os.getenv("DB_NAME", "event_management_db")
+
+# Connection pool sizing; MIN_POOL_SIZE connections are opened at startup
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "10"))
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+
+# Upper bound for the page size accepted by list endpoints
+MAX_PAGE_SIZE = 500
+
+async def create_indexes(db: AsyncDatabase):
+    """
+    Creates the indexes used by reference lookups and filters.
+    create_index is idempotent, so this is safe to run on every startup.
+    """
+    await asyncio.gather(
+        db.bookings.create_index([("event_id", 1)]),
+        db.bookings.create_index([("attendee_id", 1)]),
+        db.events.create_index([("venue_id", 1)]),
+        create_unique_email_index(db),
+    )
+
+async def create_unique_email_index(db: AsyncDatabase):
+    """
+    Creates the unique index on attendees.email.
+    Databases created before emails were unique may already hold duplicates,
+    which makes the index build fail. In that case the duplicated emails are
+    logged and the API starts without the index (duplicates are then not
+    rejected) until they are cleaned up.
+    """
+    try:
+        await db.attendees.create_index([("email", 1)], unique=True)
+    except OperationFailure as exc:
+        if exc.code != 11000:
+            raise
+        cursor = await db.attendees.aggregate([
+            {"$group": {"_id": "$email", "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}},
+        ])
+        duplicates = [doc["_id"] for doc in await cursor.to_list(length=None)]
+        logger.error(
+            "Unique index on attendees.email not created; duplicated emails: %s. "
+            "Remove or rename the duplicate attendees and restart the API.",
+            ", ".join(map(str, duplicates)),
+        )
+
+async def backfill_remaining_capacity(db: AsyncDatabase):
+    """
+    Sets the remaining ticket count on events created before capacity
+    tracking existed: max_attendees minus the tickets already booked.
+    Runs as a single server-side aggregation and only touches events
+    without a remaining field, so it is safe to run on every startup.
+    The merge never overwrites an existing remaining value, so a worker
+    that starts later cannot undo bookings another worker already took.
+    """
+    pipeline = [
+        {"$match": {"remaining": {"$exists": False}}},
+        {"$lookup": {
+            "from": "bookings",
+            "let": {"event_id": {"$toString": "$_id"}},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$event_id", "$$event_id"]}}},
+                {"$group": {"_id": None, "tickets": {"$sum": "$tickets"}}},
+            ],
+            "as": "booked",
+        }},
+        {"$project": {
+            "remaining": {
+                "$subtract": ["$max_attendees", {"$ifNull": [{"$first": "$booked.tickets"}, 0]}]
+            },
+        }},
+        {"$merge": {
+            "into": "events",
+            "on": "_id",
+            "whenMatched": [{"$set": {"remaining": {"$ifNull": ["$remaining", "$$new.remaining"]}}}],
+            "whenNotMatched": "discard",
+        }},
+    ]
+    cursor = await db.events.aggregate(pipeline)
+    await cursor.to_list(length=None)
+
+def get_db(request: Request) -> AsyncDatabase:
+    """Returns the database handle created during application startup."""
+    return request.app.state.db
+
+def get_bucket(request: Request) -> AsyncGridFSBucket:
+    """Returns the GridFS bucket created during application startup."""
+    return request.app.state.bucket
+
+# Dependency types injected into the route handlers
+DatabaseDep = Annotated[AsyncDatabase, Depends(get_db)]
+BucketDep = Annotated[AsyncGridFSBucket, Depends(get_bucket)]
+
+def to_oid(value: str, name: str) -> ObjectId:
+    """
+    Convert a string to an ObjectId, parsing it only once.
+    Malformed ids are rejected with a 400 before any query is sent to MongoDB.
+    """
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail=f"Invalid {name} id")
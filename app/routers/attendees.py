@@ -0,0 +1,90 @@
+# ----------------------------
+#  ATTENDEES (CRUD)
+# ----------------------------
+
+from fastapi import APIRouter, HTTPException, Query
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from pydantic import BaseModel, Field
+from typing import Optional, List
+
+from app.db import DatabaseDep, MAX_PAGE_SIZE, to_oid
+
+router = APIRouter()
+
+class AttendeeIn(BaseModel):
+    name: str = Field(..., min_length=2)
+    email: str = Field(..., min_length=5)
+    phone: Optional[str] = None
+
+class AttendeeOut(AttendeeIn):
+    id: str
+
+# Fields read by attendee_out
+ATTENDEE_PROJ = {"_id": 1, "name": 1, "email": 1, "phone": 1}
+
+def attendee_out(doc) -> dict:
+    return {
+        "id": str(doc["_id"]),
+        "name": doc["name"],
+        "email": doc["email"],
+        "phone": doc.get("phone"),
+    }
+
+@router.post("/attendees", response_model=AttendeeOut)
+async def create_attendee(attendee: AttendeeIn, db: DatabaseDep):
+    doc = attendee.model_dump()
+    try:
+        await db.attendees.insert_one(doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Attendee email already exists")
+    return attendee_out(doc)
+
+@router.get("/attendees", response_model=List[AttendeeOut])
+async def list_attendees(
+    db: DatabaseDep,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+):
+    docs = await db.attendees.find(projection=ATTENDEE_PROJ).sort("_id", 1).skip(skip).limit(limit).to_list(length=limit)
+    return [attendee_out(doc) for doc in docs]
+
+@router.get("/attendees/{attendee_id}", response_model=AttendeeOut)
+async def get_attendee(attendee_id: str, db: DatabaseDep):
+    attendee_oid = to_oid(attendee_id, "attendee")
+
+    doc = await db.attendees.find_one({"_id": attendee_oid}, projection=ATTENDEE_PROJ)
+    if not doc:
+        raise HTTPException(status_code=404, detail="Attendee not found")
+
+    return attendee_out(doc)
+
+@router.put("/attendees/{attendee_id}", response_model=AttendeeOut)
+async def update_attendee(attendee_id: str, attendee: AttendeeIn, db: DatabaseDep):
+    attendee_oid = to_oid(attendee_id, "attendee")
+
+    # Update and read back the new document in a single round-trip
+    try:
+        doc = await db.attendees.find_one_and_update(
+            {"_id": attendee_oid},
+            {"$set": attendee.model_dump()},
+            projection=ATTENDEE_PROJ,
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Attendee email already exists")
+
+    if not doc:
+        raise HTTPException(status_code=404, detail="Attendee not found")
+
+    return attendee_out(doc)
+
+@router.delete("/attendees/{attendee_id}")
+async def delete_attendee(attendee_id: str, db: DatabaseDep):
+    attendee_oid = to_oid(attendee_id, "attendee")
+
+    result = await db.attendees.delete_one({"_id": attendee_oid})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Attendee not found")
+
+    return {"message": "Attendee deleted"}
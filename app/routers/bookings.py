@@ -0,0 +1,260 @@
+# ----------------------------
+#  BOOKINGS (CRUD)
+# ----------------------------
+
+from fastapi import APIRouter, HTTPException, Query, Body
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, WriteError
+from pymongo.asynchronous.database import AsyncDatabase
+from bson import ObjectId
+from pydantic import BaseModel, Field
+from typing import Annotated, List
+from collections import defaultdict
+import asyncio
+
+from app.db import DatabaseDep, MAX_PAGE_SIZE, to_oid
+
+# Upper bound for the number of bookings accepted by POST /bookings/bulk
+MAX_BULK_BOOKINGS = 500
+
+router = APIRouter()
+
+class BookingIn(BaseModel):
+    event_id: str = Field(..., min_length=24)     # ObjectId str
+    attendee_id: str = Field(..., min_length=24)  # ObjectId str
+    tickets: int = Field(..., ge=1)
+    booking_date: str = Field(..., min_length=4)  # ISO string recommended
+
+class BookingOut(BookingIn):
+    id: str
+
+class BulkBookingOut(BaseModel):
+    inserted_ids: List[str]
+    failed_indexes: List[int] = []
+
+# Fields read by booking_out
+BOOKING_PROJ = {"_id": 1, "event_id": 1, "attendee_id": 1, "tickets": 1, "booking_date": 1}
+
+async def ensure_event_and_attendee(db: AsyncDatabase, event_oid: ObjectId, attendee_oid: ObjectId):
+    """
+    Checks that a booking's event and attendee both exist in one round-trip.
+    The event is matched by _id and the attendee is joined in with $lookup,
+    so MongoDB performs both lookups server-side.
+    Raises 404 for whichever reference is missing (event first).
+    """
+    pipeline = [
+        {"$match": {"_id": event_oid}},
+        {"$project": {"_id": 1}},
+        {"$lookup": {
+            "from": "attendees",
+            "pipeline": [
+                {"$match": {"_id": attendee_oid}},
+                {"$project": {"_id": 1}},
+            ],
+            "as": "attendee",
+        }},
+    ]
+    cursor = await db.events.aggregate(pipeline)
+    docs = await cursor.to_list(length=1)
+
+    if not docs:
+        raise HTTPException(status_code=404, detail="Event not found")
+    if not docs[0]["attendee"]:
+        raise HTTPException(status_code=404, detail="Attendee not found")
+
+async def reserve_tickets(db: AsyncDatabase, event_oid: ObjectId, tickets: int) -> bool:
+    """
+    Takes tickets from an event's remaining capacity in one atomic update.
+    The filter only matches while enough tickets are left, so concurrent
+    bookings can never overbook an event. Returns False when it is full.
+    """
+    result = await db.events.update_one(
+        {"_id": event_oid, "remaining": {"$gte": tickets}},
+        {"$inc": {"remaining": -tickets}}
+    )
+    return result.modified_count == 1
+
+async def release_tickets(db: AsyncDatabase, event_oid: ObjectId, tickets: int):
+    """Returns tickets to an event's remaining capacity."""
+    await db.events.update_one(
+        {"_id": event_oid},
+        {"$inc": {"remaining": tickets}}
+    )
+
+def booking_out(doc) -> dict:
+    return {
+        "id": str(doc["_id"]),
+        "event_id": doc["event_id"],
+        "attendee_id": doc["attendee_id"],
+        "tickets": doc["tickets"],
+        "booking_date": doc["booking_date"],
+    }
+
+@router.post("/bookings", response_model=BookingOut)
+async def create_booking(booking: BookingIn, db: DatabaseDep):
+    # validate ids
+    event_oid = to_oid(booking.event_id, "event")
+    attendee_oid = to_oid(booking.attendee_id, "attendee")
+
+    # ensure event and attendee exist (single aggregation round-trip)
+    await ensure_event_and_attendee(db, event_oid, attendee_oid)
+
+    if not await reserve_tickets(db, event_oid, booking.tickets):
+        raise HTTPException(status_code=409, detail="Not enough tickets remaining for this event")
+
+    doc = booking.model_dump()
+    try:
+        await db.bookings.insert_one(doc)
+    except WriteError:
+        # The server rejected the insert, so the booking definitely does not exist.
+        # Other errors (e.g. a lost connection) leave it unknown whether the insert
+        # happened; the tickets stay reserved rather than risk overbooking.
+        await release_tickets(db, event_oid, booking.tickets)
+        raise
+    return booking_out(doc)
+
+@router.post("/bookings/bulk", response_model=BulkBookingOut)
+async def bulk_create_bookings(
+    bookings: Annotated[List[BookingIn], Body(min_length=1, max_length=MAX_BULK_BOOKINGS)],
+    db: DatabaseDep,
+):
+    """
+    Creates many bookings in a single request.
+    All referenced events and attendees are checked with one query per
+    collection, capacity is reserved with one conditional update per event,
+    and the bookings are written with a single insert_many.
+    If any event is full, nothing is booked. Bookings the server rejects
+    on insert are reported in failed_indexes and their tickets released.
+    """
+    # parse every id once; the (event, attendee) pairs are reused below
+    oids = [(to_oid(b.event_id, "event"), to_oid(b.attendee_id, "attendee")) for b in bookings]
+    event_oids = {event_oid for event_oid, _ in oids}
+    attendee_oids = {attendee_oid for _, attendee_oid in oids}
+
+    # ensure every referenced event and attendee exists (one query each, run concurrently)
+    found_events, found_attendees = await asyncio.gather(
+        db.events.distinct("_id", {"_id": {"$in": list(event_oids)}}),
+        db.attendees.distinct("_id", {"_id": {"$in": list(attendee_oids)}}),
+    )
+    missing_events = event_oids - set(found_events)
+    if missing_events:
+        missing = ", ".join(str(oid) for oid in missing_events)
+        raise HTTPException(status_code=404, detail=f"Event not found: {missing}")
+    missing_attendees = attendee_oids - set(found_attendees)
+    if missing_attendees:
+        missing = ", ".join(str(oid) for oid in missing_attendees)
+        raise HTTPException(status_code=404, detail=f"Attendee not found: {missing}")
+
+    # reserve capacity per event; roll back every reservation if any event is full
+    requested = defaultdict(int)
+    for (event_oid, _), b in zip(oids, bookings):
+        requested[event_oid] += b.tickets
+    reserved = await asyncio.gather(
+        *(reserve_tickets(db, oid, tickets) for oid, tickets in requested.items())
+    )
+    if not all(reserved):
+        outcomes = list(zip(requested.items(), reserved))
+        await asyncio.gather(
+            *(release_tickets(db, oid, tickets) for (oid, tickets), ok in outcomes if ok)
+        )
+        full = ", ".join(str(oid) for (oid, _), ok in outcomes if not ok)
+        raise HTTPException(status_code=409, detail=f"Not enough tickets remaining for event: {full}")
+
+    # insert_many adds the generated _id to each doc
+    docs = [b.model_dump() for b in bookings]
+    try:
+        await db.bookings.insert_many(docs, ordered=False)
+        failed = set()
+    except BulkWriteError as exc:
+        # With ordered=False the other bookings are still written; give back
+        # only the tickets of the ones that failed
+        failed = {error["index"] for error in exc.details["writeErrors"]}
+        released = defaultdict(int)
+        for i in failed:
+            released[oids[i][0]] += bookings[i].tickets
+        await asyncio.gather(
+            *(release_tickets(db, oid, tickets) for oid, tickets in released.items())
+        )
+
+    return {
+        "inserted_ids": [str(doc["_id"]) for i, doc in enumerate(docs) if i not in failed],
+        "failed_indexes": sorted(failed),
+    }
+
+@router.get("/bookings", response_model=List[BookingOut])
+async def list_bookings(
+    db: DatabaseDep,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+):
+    docs = await db.bookings.find(projection=BOOKING_PROJ).sort("_id", 1).skip(skip).limit(limit).to_list(length=limit)
+    return [booking_out(doc) for doc in docs]
+
+@router.get("/bookings/{booking_id}", response_model=BookingOut)
+async def get_booking(booking_id: str, db: DatabaseDep):
+    booking_oid = to_oid(booking_id, "booking")
+
+    doc = await db.bookings.find_one({"_id": booking_oid}, projection=BOOKING_PROJ)
+    if not doc:
+        raise HTTPException(status_code=404, detail="Booking not found")
+
+    return booking_out(doc)
+
+@router.put("/bookings/{booking_id}", response_model=BookingOut)
+async def update_booking(booking_id: str, booking: BookingIn, db: DatabaseDep):
+    booking_oid = to_oid(booking_id, "booking")
+    event_oid = to_oid(booking.event_id, "event")
+    attendee_oid = to_oid(booking.attendee_id, "attendee")
+
+    await ensure_event_and_attendee(db, event_oid, attendee_oid)
+
+    old = await db.bookings.find_one({"_id": booking_oid}, {"event_id": 1, "tickets": 1})
+    if not old:
+        raise HTTPException(status_code=404, detail="Booking not found")
+
+    # Reserve only the extra tickets this update needs: the difference when the
+    # event is unchanged, or the full amount when moving to another event
+    old_event_oid = ObjectId(old["event_id"])
+    same_event = old_event_oid == event_oid
+    extra = booking.tickets - old["tickets"] if same_event else booking.tickets
+    if extra > 0 and not await reserve_tickets(db, event_oid, extra):
+        raise HTTPException(status_code=409, detail="Not enough tickets remaining for this event")
+
+    # Update and read back the new document in a single round-trip. The filter
+    # only matches the booking as it was read above, so a concurrent update
+    # cannot make both requests adjust capacity from the same snapshot.
+    doc = await db.bookings.find_one_and_update(
+        {"_id": booking_oid, "event_id": old["event_id"], "tickets": old["tickets"]},
+        {"$set": booking.model_dump()},
+        projection=BOOKING_PROJ,
+        return_document=ReturnDocument.AFTER
+    )
+
+    if not doc:
+        if extra > 0:
+            await release_tickets(db, event_oid, extra)
+        if not await db.bookings.find_one({"_id": booking_oid}, {"_id": 1}):
+            raise HTTPException(status_code=404, detail="Booking not found")
+        raise HTTPException(status_code=409, detail="Booking was modified concurrently, please retry")
+
+    # Give back tickets the booking no longer holds
+    if same_event and extra < 0:
+        await release_tickets(db, event_oid, -extra)
+    elif not same_event:
+        await release_tickets(db, old_event_oid, old["tickets"])
+
+    return booking_out(doc)
+
+@router.delete("/bookings/{booking_id}")
+async def delete_booking(booking_id: str, db: DatabaseDep):
+    booking_oid = to_oid(booking_id, "booking")
+
+    doc = await db.bookings.find_one_and_delete(
+        {"_id": booking_oid},
+        projection={"event_id": 1, "tickets": 1}
+    )
+    if not doc:
+        raise HTTPException(status_code=404, detail="Booking not found")
+
+    await release_tickets(db, ObjectId(doc["event_id"]), doc["tickets"])
+    return {"message": "Booking deleted"}
@@ -0,0 +1,135 @@
+# ----------------------------
+#  EVENTS (CRUD)
+# ----------------------------
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi_cache.decorator import cache
+from pymongo import ReturnDocument
+from pydantic import BaseModel, Field
+from typing import Optional, List
+
+from app.cache import LIST_CACHE_EXPIRE, ITEM_CACHE_EXPIRE, clear_cache
+from app.db import DatabaseDep, MAX_PAGE_SIZE, to_oid
+
+router = APIRouter()
+
+class EventIn(BaseModel):
+    name: str = Field(..., min_length=2)
+    description: Optional[str] = None
+    venue_id: str = Field(..., min_length=24)  # ObjectId as string
+    date: str = Field(..., min_length=4)  # keep simple (ISO string recommended)
+    max_attendees: int = Field(..., ge=1)
+
+class EventOut(EventIn):
+    id: str
+    poster_file_id: Optional[str] = None
+    promo_video_file_id: Optional[str] = None
+
+# Fields read by event_out
+EVENT_PROJ = {
+    "_id": 1,
+    "name": 1,
+    "description": 1,
+    "venue_id": 1,
+    "date": 1,
+    "max_attendees": 1,
+    "poster_file_id": 1,
+    "promo_video_file_id": 1,
+}
+
+def event_out(doc) -> dict:
+    return {
+        "id": str(doc["_id"]),
+        "name": doc["name"],
+        "description": doc.get("description"),
+        "venue_id": doc["venue_id"],
+        "date": doc["date"],
+        "max_attendees": doc["max_attendees"],
+        "poster_file_id": doc.get("poster_file_id"),
+        "promo_video_file_id": doc.get("promo_video_file_id"),
+    }
+
+@router.post("/events", response_model=EventOut)
+async def create_event(event: EventIn, db: DatabaseDep):
+    # validate venue_id
+    venue_oid = to_oid(event.venue_id, "venue")
+
+    # ensure venue exists
+    venue = await db.venues.find_one({"_id": venue_oid}, {"_id": 1})
+    if not venue:
+        raise HTTPException(status_code=404, detail="Venue not found")
+
+    doc = event.model_dump()
+    # remaining tracks unbooked tickets; bookings decrement it atomically
+    doc["remaining"] = event.max_attendees
+    await db.events.insert_one(doc)
+    await clear_cache("events")
+    return event_out(doc)
+
+@router.get("/events", response_model=List[EventOut])
+@cache(expire=LIST_CACHE_EXPIRE, namespace="events")
+async def list_events(
+    db: DatabaseDep,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+):
+    docs = await db.events.find(projection=EVENT_PROJ).sort("_id", 1).skip(skip).limit(limit).to_list(length=limit)
+    return [event_out(doc) for doc in docs]
+
+@router.get("/events/{event_id}", response_model=EventOut)
+@cache(expire=ITEM_CACHE_EXPIRE, namespace="events")
+async def get_event(event_id: str, db: DatabaseDep):
+    event_oid = to_oid(event_id, "event")
+
+    doc = await db.events.find_one({"_id": event_oid}, projection=EVENT_PROJ)
+    if not doc:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    return event_out(doc)
+
+@router.put("/events/{event_id}", response_model=EventOut)
+async def update_event(event_id: str, event: EventIn, db: DatabaseDep):
+    event_oid = to_oid(event_id, "event")
+    venue_oid = to_oid(event.venue_id, "venue")
+
+    venue = await db.venues.find_one({"_id": venue_oid}, {"_id": 1})
+    if not venue:
+        raise HTTPException(status_code=404, detail="Venue not found")
+
+    # Shift the remaining capacity by the change in max_attendees. The filter
+    # rejects lowering the limit below the number of tickets already booked;
+    # other edits are always allowed, even on events that were overbooked
+    # before capacity tracking existed (negative remaining).
+    # Values are wrapped in $literal so strings starting with "$" stay literal.
+    new_remaining = {"$add": ["$remaining", {"$subtract": [event.max_attendees, "$max_attendees"]}]}
+    doc = await db.events.find_one_and_update(
+        {"_id": event_oid, "$expr": {"$or": [
+            {"$gte": [event.max_attendees, "$max_attendees"]},
+            {"$gte": [new_remaining, 0]},
+        ]}},
+        [{"$set": {
+            **{field: {"$literal": value} for field, value in event.model_dump().items()},
+            "remaining": new_remaining,
+        }}],
+        projection=EVENT_PROJ,
+        return_document=ReturnDocument.AFTER
+    )
+
+    if not doc:
+        if not await db.events.find_one({"_id": event_oid}, {"_id": 1}):
+            raise HTTPException(status_code=404, detail="Event not found")
+        raise HTTPException(status_code=409, detail="max_attendees is lower than the tickets already booked")
+
+    await clear_cache("events")
+    return event_out(doc)
+
+@router.delete("/events/{event_id}")
+async def delete_event(event_id: str, db: DatabaseDep):
+    event_oid = to_oid(event_id, "event")
+
+    result = await db.events.delete_one({"_id": event_oid})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    await clear_cache("events")
+    return {"message": "Event deleted"}
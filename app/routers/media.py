@@ -0,0 +1,180 @@
+# ----------------------------
+#  MEDIA (GridFS) ENDPOINTS
+# ----------------------------
+
+from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi.responses import StreamingResponse
+from gridfs import AsyncGridFSBucket
+from pymongo import ReturnDocument
+from pymongo.asynchronous.collection import AsyncCollection
+from bson import ObjectId
+import gridfs
+
+from app.cache import clear_cache
+from app.db import DatabaseDep, BucketDep, to_oid
+
+router = APIRouter()
+
+async def gridfs_response(bucket: AsyncGridFSBucket, file_id: str) -> StreamingResponse:
+    """
+    Streams a GridFS file to the client one chunk at a time,
+    so memory use stays at a single chunk regardless of file size.
+    """
+    try:
+        grid_out = await bucket.open_download_stream(ObjectId(file_id))
+    except gridfs.errors.NoFile:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    # New uploads keep the MIME type in metadata; older ones stored it top-level
+    metadata = grid_out.metadata or {}
+    content_type = metadata.get("contentType") or grid_out.content_type
+
+    async def iter_chunks():
+        try:
+            # readchunk() returns one GridFS chunk document per call
+            while chunk := await grid_out.readchunk():
+                yield chunk
+        finally:
+            await grid_out.close()
+
+    return StreamingResponse(
+        iter_chunks(),
+        media_type=content_type or "application/octet-stream",
+        headers={"Content-Disposition": f'inline; filename="{grid_out.filename}"'}
+    )
+
+async def gridfs_upload(bucket: AsyncGridFSBucket, file: UploadFile, meta: dict) -> ObjectId:
+    """
+    Streams an uploaded file into GridFS one chunk at a time, so the whole
+    upload is never held in memory. Returns the new GridFS file ID.
+    """
+    grid_in = bucket.open_upload_stream(
+        file.filename,
+        metadata={"contentType": file.content_type, **meta}
+    )
+
+    try:
+        # Read in GridFS-sized pieces so each write flushes one chunk document
+        while chunk := await file.read(gridfs.DEFAULT_CHUNK_SIZE):
+            await grid_in.write(chunk)
+        await grid_in.close()
+    except Exception:
+        await grid_in.abort()
+        raise
+
+    return grid_in._id
+
+async def attach_file(
+    collection: AsyncCollection,
+    bucket: AsyncGridFSBucket,
+    doc_oid: ObjectId,
+    field: str,
+    file_id: ObjectId,
+) -> bool:
+    """
+    Saves a GridFS file ID on a venue or event document.
+    find_one_and_update sets the new ID and returns the previous one in a
+    single command, so a replaced file can be removed from GridFS.
+    If the document does not exist, the new upload is deleted and False is returned.
+    """
+    previous = await collection.find_one_and_update(
+        {"_id": doc_oid},
+        {"$set": {field: str(file_id)}},
+        projection={field: 1},
+        return_document=ReturnDocument.BEFORE
+    )
+
+    if previous is None:
+        await bucket.delete(file_id)
+        return False
+
+    if previous.get(field):
+        try:
+            await bucket.delete(ObjectId(previous[field]))
+        except gridfs.errors.NoFile:
+            pass
+
+    return True
+
+@router.post("/venues/{venue_id}/photo")
+async def upload_venue_photo(venue_id: str, db: DatabaseDep, bucket: BucketDep, file: UploadFile = File(...)):
+    venue_oid = to_oid(venue_id, "venue")
+
+    file_id = await gridfs_upload(bucket, file, {"type": "venue_photo", "venue_id": venue_id})
+
+    if not await attach_file(db.venues, bucket, venue_oid, "photo_file_id", file_id):
+        raise HTTPException(status_code=404, detail="Venue not found")
+
+    return {"message": "Venue photo uploaded", "file_id": str(file_id)}
+
+
+@router.get("/venues/{venue_id}/photo")
+async def get_venue_photo(venue_id: str, db: DatabaseDep, bucket: BucketDep):
+    venue_oid = to_oid(venue_id, "venue")
+
+    venue = await db.venues.find_one({"_id": venue_oid}, {"photo_file_id": 1})
+    if not venue or "photo_file_id" not in venue:
+        raise HTTPException(status_code=404, detail="Venue photo not found")
+
+    file_id = venue["photo_file_id"]
+    return await gridfs_response(bucket, file_id)
+
+
+@router.post("/events/{event_id}/poster")
+async def upload_event_poster(event_id: str, db: DatabaseDep, bucket: BucketDep, file: UploadFile = File(...)):
+    event_oid = to_oid(event_id, "event")
+
+    file_id = await gridfs_upload(bucket, file, {"type": "event_poster", "event_id": event_id})
+
+    if not await attach_file(db.events, bucket, event_oid, "poster_file_id", file_id):
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    await clear_cache("events")
+    return {"message": "Event poster uploaded", "file_id": str(file_id)}
+
+
+@router.get("/events/{event_id}/poster")
+async def get_event_poster(event_id: str, db: DatabaseDep, bucket: BucketDep):
+    event_oid = to_oid(event_id, "event")
+
+    event = await db.events.find_one({"_id": event_oid}, {"poster_file_id": 1})
+    if not event or "poster_file_id" not in event:
+        raise HTTPException(status_code=404, detail="Event poster not found")
+
+    file_id = event["poster_file_id"]
+    return await gridfs_response(bucket, file_id)
+
+
+@router.post("/events/{event_id}/promo-video")
+async def upload_event_video(event_id: str, db: DatabaseDep, bucket: BucketDep, file: UploadFile = File(...)):
+    """
+    Uploads a promotional video for an event.
+    The file is stored in MongoDB GridFS, and the file ID is saved
+    in the corresponding event document.
+    """
+    event_oid = to_oid(event_id, "event")
+
+    # Stream the file into GridFS
+    file_id = await gridfs_upload(bucket, file, {"type": "promo_video", "event_id": event_id})
+
+    # Save GridFS file ID in the event document (replacing any previous video)
+    if not await attach_file(db.events, bucket, event_oid, "promo_video_file_id", file_id):
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    await clear_cache("events")
+    return {"message": "Promo video uploaded", "file_id": str(file_id)}
+
+
+@router.get("/events/{event_id}/promo-video")
+async def get_event_video(event_id: str, db: DatabaseDep, bucket: BucketDep):
+    """
+    Streams a promotional video from MongoDB GridFS.
+    """
+    event_oid = to_oid(event_id, "event")
+
+    event = await db.events.find_one({"_id": event_oid}, {"promo_video_file_id": 1})
+    if not event or "promo_video_file_id" not in event:
+        raise HTTPException(status_code=404, detail="Promo video not found")
+
+    file_id = event["promo_video_file_id"]
+    return await gridfs_response(bucket, file_id)
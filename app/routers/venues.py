@@ -0,0 +1,105 @@
+# ----------------------------
+#  VENUE ENDPOINTS
+# ----------------------------
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi_cache.decorator import cache
+from pymongo import ReturnDocument
+from pydantic import BaseModel, Field
+from typing import List
+
+from app.cache import LIST_CACHE_EXPIRE, ITEM_CACHE_EXPIRE, clear_cache
+from app.db import DatabaseDep, MAX_PAGE_SIZE, to_oid
+
+router = APIRouter()
+
+class VenueIn(BaseModel):
+    """
+    Input model for venue creation and updates.
+    Validation rules help prevent malformed or malicious input.
+    """
+    name: str = Field(..., min_length=2)
+    address: str = Field(..., min_length=3)
+    capacity: int = Field(..., ge=1)
+
+class VenueOut(VenueIn):
+    """
+    Output model returned by the API.
+    Includes the MongoDB-generated ID as a string.
+    """
+    id: str
+
+# Fields read by venue_out; queries project to these so unused fields are never fetched
+VENUE_PROJ = {"_id": 1, "name": 1, "address": 1, "capacity": 1}
+
+# The *_out helpers return plain dicts: FastAPI already validates the result
+# against response_model, so building a Pydantic model here would validate twice
+def venue_out(doc) -> dict:
+    return {
+        "id": str(doc["_id"]),
+        "name": doc["name"],
+        "address": doc["address"],
+        "capacity": doc["capacity"],
+    }
+
+@router.post("/venues", response_model=VenueOut)
+async def create_venue(venue: VenueIn, db: DatabaseDep):
+    doc = venue.model_dump()
+    await db.venues.insert_one(doc)
+    await clear_cache("venues")
+    # insert_one adds the generated _id to doc
+    return venue_out(doc)
+
+@router.get("/venues", response_model=List[VenueOut])
+@cache(expire=LIST_CACHE_EXPIRE, namespace="venues")
+async def list_venues(
+    db: DatabaseDep,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+):
+    docs = await db.venues.find(projection=VENUE_PROJ).sort("_id", 1).skip(skip).limit(limit).to_list(length=limit)
+    return [venue_out(doc) for doc in docs]
+
+@router.get("/venues/{venue_id}", response_model=VenueOut)
+@cache(expire=ITEM_CACHE_EXPIRE, namespace="venues")
+async def get_venue(venue_id: str, db: DatabaseDep):
+    """
+    Retrieve a single venue by ID.
+    Validates ObjectId before querying MongoDB to prevent malformed queries.
+    """
+    venue_oid = to_oid(venue_id, "venue")
+
+    doc = await db.venues.find_one({"_id": venue_oid}, projection=VENUE_PROJ)
+    if not doc:
+        raise HTTPException(status_code=404, detail="Venue not found")
+
+    return venue_out(doc)
+
+@router.put("/venues/{venue_id}", response_model=VenueOut)
+async def update_venue(venue_id: str, venue: VenueIn, db: DatabaseDep):
+    venue_oid = to_oid(venue_id, "venue")
+
+    # Update and read back the new document in a single round-trip
+    doc = await db.venues.find_one_and_update(
+        {"_id": venue_oid},
+        {"$set": venue.model_dump()},
+        projection=VENUE_PROJ,
+        return_document=ReturnDocument.AFTER
+    )
+
+    if not doc:
+        raise HTTPException(status_code=404, detail="Venue not found")
+
+    await clear_cache("venues")
+    return venue_out(doc)
+
+@router.delete("/venues/{venue_id}")
+async def delete_venue(venue_id: str, db: DatabaseDep):
+    venue_oid = to_oid(venue_id, "venue")
+
+    result = await db.venues.delete_one({"_id": venue_oid})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Venue not found")
+
+    await clear_cache("venues")
+    return {"message": "Venue deleted"}